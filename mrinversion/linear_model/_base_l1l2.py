@@ -244,7 +244,8 @@ class GeneralL2Lasso:
         if not isinstance(s, cp.CSDM):
             return residue
 
-        residue = cp.as_csdm(residue.T.copy())
+        # residue is a fresh temporary; only a layout conversion is needed.
+        residue = cp.as_csdm(np.ascontiguousarray(residue.T))
         residue._dimensions = s._dimensions
         return residue
 
@@ -399,7 +400,7 @@ class GeneralL2LassoCV:
 
     def cv_map_to_csdm(self):
         # convert cv_map to csdm
-        self.cv_map = cp.as_csdm(np.squeeze(self.cv_map.T.copy()))
+        self.cv_map = cp.as_csdm(np.ascontiguousarray(np.squeeze(self.cv_map.T)))
         if len(self.cv_alphas) != 1:
             d0 = cp.as_dimension(-np.log10(self.cv_alphas), label="-log(α)")
             self.cv_map.dimensions[0] = d0
@@ -672,6 +673,7 @@ def prepare_signal(sig):
     s_ = sig.y[0].components[0].T if isinstance(sig, cp.CSDM) else sig
     s_ = s_[:, np.newaxis] if s_.ndim == 1 else s_
 
-    scale = np.sqrt(np.mean(np.abs(s_) ** 2))
+    # root-mean-square scale via BLAS nrm2; one pass, no |s|² temporaries.
+    scale = np.linalg.norm(s_) / np.sqrt(s_.size)
     s_ = s_ / scale
     return s_, scale
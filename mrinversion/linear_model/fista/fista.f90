@@ -2,7 +2,8 @@
 
 subroutine fista(matrix, s, zf, lambd, maxiter, f_k, &
                 checkFunction, residue, matrixrow, matrixcolumn, &
-                nonnegative, Linv, totalappend, iter, cpu_time_, wall_time_, tol, npros)
+                nonnegative, Linv, totalappend, iter, cpu_time_, wall_time_, tol, npros, &
+                gram, cin, precomputed)
 
 use omp_lib
 
@@ -10,6 +11,15 @@ use omp_lib
     integer*4, intent(in) :: matrixrow, matrixcolumn, npros
 !f2py integer*4, intent(in) :: matrixrow, matrixcolumn, npros
 
+    integer*4, intent(in) :: precomputed
+!f2py integer*4, optional, intent(in) :: precomputed = 0
+
+    double precision, intent(in), dimension(0:matrixcolumn-1, 0:matrixcolumn-1) :: gram
+!f2py double precision, optional, intent(in) :: gram
+
+    double precision, intent(in), dimension(0:matrixcolumn-1, 0:totalappend-1) :: cin
+!f2py double precision, optional, intent(in) :: cin
+
     integer*4, intent(out) :: iter
 !f2py integer*4, intent(out) :: iter
 
@@ -65,13 +75,21 @@ use omp_lib
     t_kp1 = 1.0
 
     y_k = f_k
-    !Gradient = MATMUL(TRANSPOSE(matrix), matrix)
-    call dgemm('T', 'N', matrixcolumn, matrixcolumn, matrixrow, 1.0d+0,  matrix,  &
-                matrixrow, matrix, matrixrow, 0.0d+0, Gradient, matrixcolumn)
-
-    !c = MATMUL(TRANSPOSE(matrix), s)
-    call dgemm('T', 'N', matrixcolumn, totalappend, matrixrow, 1.0d+0,  matrix,  &
-                matrixrow, s, matrixrow, 0.0d+0, c, matrixcolumn)
+    if (precomputed == 1) then
+        ! caller supplied the Gram matrix K^T K and K^T s; skip the two
+        ! dgemm calls. Useful when the same kernel is fit repeatedly, e.g.
+        ! along a lambda path.
+        Gradient = gram
+        c = cin
+    else
+        !Gradient = MATMUL(TRANSPOSE(matrix), matrix)
+        call dgemm('T', 'N', matrixcolumn, matrixcolumn, matrixrow, 1.0d+0,  matrix,  &
+                    matrixrow, matrix, matrixrow, 0.0d+0, Gradient, matrixcolumn)
+
+        !c = MATMUL(TRANSPOSE(matrix), s)
+        call dgemm('T', 'N', matrixcolumn, totalappend, matrixrow, 1.0d+0,  matrix,  &
+                    matrixrow, s, matrixrow, 0.0d+0, c, matrixcolumn)
+    endif
 
     do i = 0, totalappend-1
         s_temp = s(:,i)
@@ -3,10 +3,21 @@ import os
 import csdmpy as cp
 import matplotlib.pyplot as plt
 import numpy as np
+import scipy.linalg
+from joblib import delayed
+from joblib import Parallel
+from scipy.linalg.blas import get_blas_funcs
+from scipy.sparse.linalg import eigsh
 
 from mrinversion.linear_model._base_l1l2 import prepare_signal
-from mrinversion.linear_model.fista import fista
-from mrinversion.linear_model.fista import fista_cv
+
+from mrinversion.linear_model.fista import _fista_py
+
+try:
+    from mrinversion.linear_model.fista import fista
+except ImportError:
+    # compiled extension unavailable; fall back to the Python/numba solver.
+    fista = _fista_py
 
 __author__ = "Deepansh Srivastava"
 CPU_COUNTS = os.cpu_count()
@@ -19,25 +30,44 @@ class LassoFista:
         max_iterations=50000,
         tolerance=5.2e-3,
         positive=True,
+        precision="double",
+        warm_start=False,
         inverse_dimension=None,
     ):
         self.hyperparameters = {"lambda": lambda1}
         self.max_iterations = max_iterations
         self.tolerance = tolerance
         self.positive = positive
+        self.precision = precision
+        self.warm_start = warm_start
         self.inverse_dimension = inverse_dimension
+        self._f_init = None
+        self._gemm = None
 
-    def fit(self, K, s, warm_start=False):
+    def fit(self, K, s, warm_start=False, lipszit=None):
         s_, self.scale = prepare_signal(s)
-        sin_val = np.linalg.svd(K, full_matrices=False)[1]
-
-        K_, s_ = np.asfortranarray(K), np.asfortranarray(s_)
-        self.f = np.asfortranarray(np.zeros((K_.shape[1], s_.shape[1])))
-        lipszit = sin_val[0] ** 2
+        if lipszit is None:
+            lipszit = _lipschitz_constant(K)
+
+        # the single-precision path runs the FP32 Python/numba solver; the
+        # final residual and prediction math stays in FP64.
+        single = self.precision == "single"
+        solver = _fista_py.fista_single if single else fista.fista
+        dtype = np.float32 if single else np.float64
+
+        K_ = np.asfortranarray(K, dtype=dtype)
+        s_ = np.asfortranarray(s_, dtype=dtype)
+        if self.warm_start and self._f_init is not None:
+            # continue from a solution at a nearby λ (path continuation).
+            self.f = np.array(self._f_init, dtype=dtype, order="F", copy=True)
+        else:
+            # allocate in Fortran order directly; asfortranarray(np.zeros(...))
+            # would zero-fill a C-order buffer and then copy it.
+            self.f = np.zeros((K_.shape[1], s_.shape[1]), dtype=dtype, order="F")
 
         if warm_start:
-            self.f_1 = np.asfortranarray(np.zeros((K_.shape[1], 1)))
-            _ = fista.fista(
+            self.f_1 = np.zeros((K_.shape[1], 1), dtype=dtype, order="F")
+            _ = solver(
                 matrix=K_,
                 s=s_.mean(axis=1),
                 lambd=self.hyperparameters["lambda"],
@@ -48,9 +78,10 @@ class LassoFista:
                 tol=self.tolerance,
                 npros=1,
             )
-            self.f = np.asfortranarray(np.tile(self.f_1, s_.shape[1]))
+            self.f = np.empty((K_.shape[1], s_.shape[1]), dtype=dtype, order="F")
+            self.f[:] = self.f_1
 
-        _ = fista.fista(
+        _ = solver(
             matrix=K_,
             s=s_,
             lambd=self.hyperparameters["lambda"],
@@ -62,6 +93,8 @@ class LassoFista:
             npros=1,
         )
 
+        if single:
+            self.f = self.f.astype(np.float64)
         self.f *= self.scale
 
         if not isinstance(s, cp.CSDM):
@@ -101,6 +134,12 @@ class LassoFista:
             A numpy array of shape (m, m_count) with the predicted values
         """
         f = self.f.y[0].components[0].T if isinstance(self.f, cp.CSDM) else self.f
+        if f.ndim == 2 and K.dtype == f.dtype:
+            # cache the bound BLAS gemm per dtype to skip the per-call
+            # dispatch in the cross-validation residual path.
+            if self._gemm is None or self._gemm[0] != K.dtype:
+                self._gemm = (K.dtype, get_blas_funcs("gemm", (K, f)))
+            return self._gemm[1](1.0, K, f)
         return np.dot(K, f)
 
     def residuals(self, K, s):
@@ -135,7 +174,8 @@ class LassoFista:
         if not isinstance(s, cp.CSDM):
             return residue
 
-        residue = cp.as_csdm(residue.T.copy())
+        # residue is a fresh temporary; only a layout conversion is needed.
+        residue = cp.as_csdm(np.ascontiguousarray(residue.T))
         residue._dimensions = s._dimensions
         return residue
 
@@ -148,17 +188,21 @@ class LassoFistaCV:
         max_iterations=50000,
         tolerance=5.2e-3,
         positive=True,
+        precision="double",
         sigma=0.0,
         randomize=False,
         times=1,
         inverse_dimension=None,
         n_jobs=CPU_COUNTS,
+        device=None,
     ):
-        self.cv_lambdas = lambdas
+        self.cv_lambdas = np.asarray(lambdas).ravel()
         self.folds = folds
+        self.device = device
         self.max_iterations = max_iterations
         self.tolerance = tolerance
         self.positive = positive
+        self.precision = precision
         self.sigma = sigma
         self.randomize = randomize
         self.times = times
@@ -181,28 +225,72 @@ class LassoFistaCV:
                 csdm object or a numpy array or shape (m, m_count).
         """
         s_, self.scale = prepare_signal(s)
-        sin_val = np.linalg.svd(K, full_matrices=False)[1]
+        lipszit = _lipschitz_constant(K)
 
         K_, s_ = np.asfortranarray(K), np.asfortranarray(s_)
-        lipszit = sin_val[0] ** 2
         # test train CV set
-        k_train, s_train, k_test, s_test, m = test_train_set(
+        train_indexes, test_indexes = test_train_set(
             K_, s_, self.folds, self.randomize, self.times
         )
 
-        self.cv_map, self.std, _, _, _, self.prediction_error = fista_cv.fista(
-            matrix=k_train,
-            s=s_train,
-            matrixtest=k_test,
-            stest=s_test,
-            lambdaval=self.cv_lambdas,
-            maxiter=self.max_iterations,
-            nonnegative=int(self.positive),
-            linv=(1 / lipszit),
-            tol=self.tolerance,
-            npros=self.n_jobs,
-            m=m,
-        )
+        # Evaluate the λ grid in descending order so that, within a fold, each
+        # solution warm-starts the fit at the next smaller λ (lasso-path
+        # style). The folds are embarrassingly parallel and are dispatched
+        # with joblib.
+        n_sets = len(train_indexes)
+        order = np.argsort(self.cv_lambdas)[::-1]
+        lambdas_desc = self.cv_lambdas[order]
+        single = self.precision == "single"
+
+        if self.device == "cuda":
+            chi2, warm_f = _lambda_path_grid_cuda(
+                K_,
+                s_,
+                train_indexes,
+                test_indexes,
+                lambdas_desc,
+                self.max_iterations,
+                int(self.positive),
+                1 / lipszit,
+                self.tolerance,
+                single,
+            )
+        elif self.n_jobs == 1:
+            chi2, warm_f = _lambda_path_grid(
+                K_,
+                s_,
+                train_indexes,
+                test_indexes,
+                lambdas_desc,
+                self.max_iterations,
+                int(self.positive),
+                1 / lipszit,
+                self.tolerance,
+                single,
+            )
+        else:
+            results = Parallel(n_jobs=self.n_jobs, backend="loky")(
+                delayed(_lambda_path_fold)(
+                    K_,
+                    s_,
+                    train_indexes[i],
+                    test_indexes[i],
+                    lambdas_desc,
+                    self.max_iterations,
+                    int(self.positive),
+                    1 / lipszit,
+                    self.tolerance,
+                    single,
+                )
+                for i in range(n_sets)
+            )
+            chi2 = np.stack([chi2_i for chi2_i, _ in results], axis=-1)
+            warm_f = [f_i for _, f_i in results]
+
+        self.prediction_error = np.empty((self.cv_lambdas.size, n_sets))
+        self.prediction_error[order] = chi2
+        self.cv_map = self.prediction_error.mean(axis=1)
+        self.std = self.prediction_error.std(axis=1)
         # subtract the variance.
         self.cv_map -= (self.sigma / self.scale) ** 2
         self.cv_map = np.abs(self.cv_map)
@@ -218,13 +306,21 @@ class LassoFistaCV:
             max_iterations=self.max_iterations,
             tolerance=self.tolerance,
             positive=self.positive,
+            precision=self.precision,
+            warm_start=True,
             inverse_dimension=self.inverse_dimension,
         )
-        self.opt.fit(K, s)
+        # Warm start the refit from the λ-path solution of the fold with the
+        # smallest prediction error at the selected λ; its training set is
+        # nearly the full data. Also reuse the Lipschitz constant computed
+        # above — the refit uses the same kernel.
+        self.opt._f_init = warm_f[int(np.argmin(self.prediction_error[l1_index]))]
+        self.opt.fit(K, s, lipszit=lipszit)
         self.f = self.opt.f
 
-        # convert cv_map to csdm
-        self.cv_map = cp.as_csdm(np.squeeze(self.cv_map.T.copy()))
+        # convert cv_map to csdm; the fold-averaged map is already 1D and
+        # contiguous, so no transpose or copy applies.
+        self.cv_map = cp.as_csdm(self.cv_map)
         self.cv_map.y[0].component_labels = ["log10"]
         d0 = cp.as_dimension(np.log10(self.cv_lambdas), label="log(λ)")
         self.cv_map.dimensions[0] = d0
@@ -301,6 +397,27 @@ class LassoFistaCV:
         plt.ylabel("test error")
 
 
+def _lipschitz_constant(K):
+    """Return the FISTA Lipschitz constant, σ₁(K)², of the kernel, K.
+
+    The squared top singular value of K equals the largest eigenvalue of
+    the Gram matrix. BLAS syrk builds the smaller of KᵀK and KKᵀ at half
+    the FLOPs of a general matrix product, and a single ARPACK Lanczos
+    run extracts its top eigenvalue in a few matvecs. Small kernels fall
+    back to the full SVD, where ARPACK does not apply.
+    """
+    if min(K.shape) < 3:
+        sigma = scipy.linalg.svd(
+            K, compute_uv=False, check_finite=False, lapack_driver="gesdd"
+        )[0]
+        return sigma**2
+    syrk = get_blas_funcs("syrk", (K,))
+    gram = syrk(1.0, K, trans=int(K.shape[0] > K.shape[1]), lower=0)
+    # syrk fills only the upper triangle; mirror it before the Lanczos run.
+    gram += np.triu(gram, 1).T
+    return eigsh(gram, k=1, which="LA", tol=1e-3, return_eigenvectors=False)[0]
+
+
 def calculate_opt_lambda(cv, std):
     l1_index = np.unravel_index(cv.argmin(), cv.shape)[0]
     cv_std = cv[l1_index] + std[l1_index]
@@ -314,51 +431,294 @@ def calculate_opt_lambda(cv, std):
     return l1_index, l1_index
 
 
-def test_train_set(X, y, folds, random=False, repeat_folds=1):
-    """Generate test and training sets"""
-    index = np.arange(X.shape[0])
+def _lambda_path_fold(
+    K,
+    s,
+    train_index,
+    test_index,
+    lambdas,
+    maxiter,
+    nonnegative,
+    linv,
+    tol,
+    single=False,
+):
+    """Evaluate the FISTA λ-path over a single cross-validation fold.
+
+    The fold's train/test kernel and signal blocks are gathered from the
+    full arrays with the given row indexes. The λ values must be sorted in
+    descending order. The solution at each λ warm-starts the fit at the
+    next smaller λ, which cuts the number of FISTA iterations along the
+    path. When ``single`` is True, the inner iterations run in float32
+    while the test errors are still accumulated in float64.
+
+    Returns the per-λ mean squared error evaluated on the test set.
+    """
+    solver = _fista_py.fista_single if single else fista.fista
+    dtype = np.float32 if single else np.float64
+    k_train = np.asfortranarray(K[train_index], dtype=dtype)
+    s_train = np.asfortranarray(s[train_index], dtype=dtype)
+    k_test, s_test = K[test_index], s[test_index]
+
+    # the fold's Gram matrix and K^T s are shared by every λ on the path.
+    gram = np.asfortranarray(np.dot(k_train.T, k_train))
+    cin = np.asfortranarray(np.dot(k_train.T, s_train))
+
+    f_k = np.zeros((K.shape[1], s.shape[1]), dtype=dtype, order="F")
+    chi2 = np.empty(lambdas.size)
+    for j, lambd in enumerate(lambdas):
+        _ = solver(
+            matrix=k_train,
+            s=s_train,
+            lambd=lambd,
+            maxiter=maxiter,
+            f_k=f_k,
+            nonnegative=nonnegative,
+            linv=linv,
+            tol=tol,
+            npros=1,
+            gram=gram,
+            cin=cin,
+            precomputed=1,
+        )
+        residue = np.dot(k_test, f_k) - s_test
+        chi2[j] = np.sum(residue**2) / (test_index.size * s.shape[1])
+    return chi2, f_k
+
+
+def _lambda_path_grid(
+    K,
+    s,
+    train_indexes,
+    test_indexes,
+    lambdas,
+    maxiter,
+    nonnegative,
+    linv,
+    tol,
+    single=False,
+):
+    """Evaluate the FISTA λ-path over the full λ × fold grid in one process.
+
+    The per-fold train/test blocks are gathered once from the full kernel
+    and signal with the given row indexes. The outer iteration runs over λ
+    (descending) and the inner over the folds. A list of per-fold solutions
+    carries the warm-start state from one λ to the next, so the grid
+    matches the parallel per-fold λ-path while keeping each fold's kernel
+    block hot in cache across consecutive λ values. When ``single`` is
+    True, the inner iterations run in float32 while the test errors are
+    still accumulated in float64.
+
+    Because every fold of a λ finishes before the next λ starts, the grid
+    supports pruning: once at least three folds of a λ place its running
+    mean error confidently above the best completed λ plus one standard
+    error — the same 1-SE margin used to report ``min_index_1s_dev`` — the
+    remaining folds of that λ are skipped and filled with the running
+    mean. The pruning is a heuristic on the raw test error: it assumes a
+    λ with a confidently larger CV error cannot be the optimum. When the
+    caller selects λ on a variance-adjusted objective (``sigma > 0`` in
+    :class:`LassoFistaCV`), a pruned λ closer to the noise floor could in
+    principle win the argmin with its filled-in running mean.
+
+    Returns the (λ, fold) matrix of mean squared test errors.
+    """
+    solver = _fista_py.fista_single if single else fista.fista
+    dtype = np.float32 if single else np.float64
+    n_sets = len(train_indexes)
+    m_count = s.shape[1]
+    k_train = [np.asfortranarray(K[index], dtype=dtype) for index in train_indexes]
+    s_train = [np.asfortranarray(s[index], dtype=dtype) for index in train_indexes]
+    # per-fold Gram matrices and K^T s, shared by every λ on the path.
+    gram = [np.asfortranarray(np.dot(k.T, k)) for k in k_train]
+    cin = [np.asfortranarray(np.dot(k.T, y)) for k, y in zip(k_train, s_train)]
+    warm = [
+        np.zeros((K.shape[1], m_count), dtype=dtype, order="F") for _ in range(n_sets)
+    ]
+    chi2 = np.empty((lambdas.size, n_sets))
+    prune_bound = np.inf
+    for j, lambd in enumerate(lambdas):
+        for i in range(n_sets):
+            _ = solver(
+                matrix=k_train[i],
+                s=s_train[i],
+                lambd=lambd,
+                maxiter=maxiter,
+                f_k=warm[i],
+                nonnegative=nonnegative,
+                linv=linv,
+                tol=tol,
+                npros=1,
+                gram=gram[i],
+                cin=cin[i],
+                precomputed=1,
+            )
+            residue = np.dot(K[test_indexes[i]], warm[i]) - s[test_indexes[i]]
+            chi2[j, i] = np.sum(residue**2) / (test_indexes[i].size * m_count)
+
+            done = i + 1
+            if 3 <= done < n_sets:
+                mean_ = chi2[j, :done].mean()
+                std_ = chi2[j, :done].std()
+                if mean_ - 2.0 * std_ / np.sqrt(done) > prune_bound:
+                    chi2[j, done:] = mean_
+                    break
+        else:
+            # only a fully evaluated λ may tighten the pruning bound.
+            bound = chi2[j].mean() + chi2[j].std() / np.sqrt(n_sets)
+            prune_bound = min(prune_bound, bound)
+    return chi2, warm
+
+
+def _lambda_path_grid_cuda(
+    K,
+    s,
+    train_indexes,
+    test_indexes,
+    lambdas,
+    maxiter,
+    nonnegative,
+    linv,
+    tol,
+    single=False,
+):
+    """Evaluate the FISTA λ-path over all folds on a CUDA device with cupy.
+
+    The per-fold train/test blocks are zero-padded to a common row count,
+    uploaded once, and every FISTA step advances all folds with a single
+    batched matmul. The zero padding does not alter the math — padded rows
+    contribute nothing to the Gram matrix or the residuals. The λ sweep
+    runs in descending order with the batched solution carried over as the
+    warm start, as in the CPU drivers. When ``single`` is True, the
+    iterations run in float32 on the device while the test errors are
+    accumulated in float64.
+
+    Returns the (λ, fold) matrix of mean squared test errors.
+    """
+    try:
+        import cupy
+    except ImportError as error:
+        raise ImportError(
+            "LassoFistaCV(device='cuda') requires the cupy package."
+        ) from error
+
+    n_sets = len(train_indexes)
+    n, m_count = K.shape[1], s.shape[1]
+
+    max_train = max(index.size for index in train_indexes)
+    max_test = max(index.size for index in test_indexes)
+    # uninitialized slabs; only the (few) padding rows are zeroed below, not
+    # the full buffers.
+    k_train = np.empty((n_sets, max_train, n))
+    s_train = np.empty((n_sets, max_train, m_count))
+    k_test = np.empty((n_sets, max_test, n))
+    s_test = np.empty((n_sets, max_test, m_count))
+    for i, (train_index, test_index) in enumerate(zip(train_indexes, test_indexes)):
+        k_train[i, : train_index.size] = K[train_index]
+        s_train[i, : train_index.size] = s[train_index]
+        k_train[i, train_index.size :] = 0.0
+        s_train[i, train_index.size :] = 0.0
+        k_test[i, : test_index.size] = K[test_index]
+        s_test[i, : test_index.size] = s[test_index]
+        k_test[i, test_index.size :] = 0.0
+        s_test[i, test_index.size :] = 0.0
+
+    dtype = np.float32 if single else np.float64
+    kb, sb = cupy.asarray(k_train, dtype=dtype), cupy.asarray(s_train, dtype=dtype)
+    ktb, stb = cupy.asarray(k_test), cupy.asarray(s_test)
+    gram = cupy.matmul(kb.transpose(0, 2, 1), kb)
+    cin = cupy.matmul(kb.transpose(0, 2, 1), sb)
+    norm = cupy.sum(sb**2, axis=(1, 2))
+    test_norm = cupy.asarray(
+        [index.size * m_count for index in test_indexes], dtype=np.float64
+    )
+
+    f_k = cupy.zeros((n_sets, n, m_count), dtype=dtype)
+    chi2 = np.empty((lambdas.size, n_sets))
+    for j, lambd in enumerate(lambdas):
+        threshold = lambd * linv
+        y_k = f_k.copy()
+        f_km1 = f_k.copy()
+        previous_check = norm.copy()
+        residue = cupy.zeros((maxiter, n_sets))
+        check_function = cupy.zeros((maxiter, n_sets))
+        t_kp1 = 1.0
+
+        for k in range(maxiter):
+            t_k = t_kp1
+            f_km1[...] = f_k
+            t_kp1 = (1.0 + np.sqrt(1.0 + 4.0 * t_k * t_k)) * 0.5
+            constant = (t_k - 1.0) / t_kp1
+
+            temp = y_k - linv * (cupy.matmul(gram, y_k) - cin)
+            if nonnegative == 1:
+                f_k = cupy.maximum(temp - threshold, 0.0)
+            else:
+                shrunk = cupy.abs(temp) - threshold
+                f_k = cupy.where(shrunk >= 0.0, shrunk * cupy.sign(temp), 0.0)
 
-    test_size = int(index.size / folds)
-    m = index.size % folds
-    train_size = index.size - test_size
+            r = cupy.matmul(kb, f_k) - sb
+            residue[k] = cupy.sum(r * r, axis=(1, 2))
+            check_function[k] = residue[k] + lambd * cupy.sum(
+                cupy.abs(f_k), axis=(1, 2)
+            )
 
-    shape_k_train = (train_size, X.shape[1], folds * repeat_folds)
-    k_train = np.zeros(shape_k_train)
+            if k >= 5:
+                temp_val = 1.0 - residue[k - 5 : k].mean(axis=0) / residue[k]
+                if bool(cupy.all(cupy.abs(temp_val) <= tol)):
+                    break
+
+            if k > 0:
+                # per-fold descent check; revert folds whose objective grew.
+                worse = check_function[k] > previous_check
+                f_k = cupy.where(worse[:, None, None], f_km1, f_k)
+                check_function[k] = cupy.where(
+                    worse, check_function[k - 1], check_function[k]
+                )
+                residue[k] = cupy.where(worse, residue[k - 1], residue[k])
 
-    shape_s_train = (train_size, y.shape[1], folds * repeat_folds)
-    s_train = np.zeros(shape_s_train)
+            previous_check = check_function[k]
+            y_k = f_k + constant * (f_k - f_km1)
 
-    shape_k_test = (test_size + 1, X.shape[1], folds * repeat_folds)
-    k_test = np.zeros(shape_k_test)
+        r = cupy.matmul(ktb, f_k) - stb
+        chi2[j] = cupy.asnumpy(cupy.sum(r * r, axis=(1, 2)) / test_norm)
 
-    shape_s_test = (test_size + 1, y.shape[1], folds * repeat_folds)
-    s_test = np.zeros(shape_s_test)
+    return chi2, list(cupy.asnumpy(f_k))
 
-    for j in range(repeat_folds):
-        if random:
-            np.random.shuffle(index)
-        for i in range(folds):
-            if random:
-                if i < m:
-                    test_index = index[i * (test_size + 1) : (i + 1) * (test_size + 1)]
-                    set_index = np.arange(
-                        i * (test_size + 1), (i + 1) * (test_size + 1)
-                    )
-                else:
-                    test_index = index[i * test_size + m : (i + 1) * test_size + m]
-                    set_index = np.arange(i * test_size + m, (i + 1) * test_size + m)
-                train_index = np.delete(index, set_index)
-            else:
-                if i < m:
-                    test_index = index[i:None:folds][: test_size + 1]
-                else:
-                    test_index = index[i:None:folds][:test_size]
-                train_index = np.delete(index, test_index)
 
-            k_train[: train_index.size, :, j * folds + i] = X[train_index]
-            s_train[: train_index.size, :, j * folds + i] = y[train_index]
+def test_train_set(X, y, folds, random=False, repeat_folds=1):
+    """Generate per-fold test and train row indexes.
+
+    Returns two lists of integer index arrays, one entry per fold (and per
+    repeat), indexing the rows of the kernel and the signal. The fold
+    workers gather the rows on demand, which avoids replicating the kernel
+    ``folds * repeat_folds`` times in zero-padded slabs.
+    """
+    index = np.arange(X.shape[0])
 
-            k_test[: test_index.size, :, j * folds + i] = X[test_index]
-            s_test[: test_index.size, :, j * folds + i] = y[test_index]
+    test_size = index.size // folds
+    m = index.size % folds
+    sizes = np.full(folds, test_size)
+    sizes[:m] += 1
+    bounds = np.cumsum(sizes)
 
-    return k_train, s_train, k_test, s_test, m
+    train_indexes = []
+    test_indexes = []
+    for _ in range(repeat_folds):
+        if random:
+            np.random.shuffle(index)
+            # folds are contiguous blocks of the shuffled index. Copy the
+            # blocks: the next repeat reshuffles ``index`` in place.
+            test_sets = [block.copy() for block in np.split(index, bounds[:-1])]
+            train_sets = [
+                np.concatenate((index[: stop - size], index[stop:]))
+                for stop, size in zip(bounds, sizes)
+            ]
+        else:
+            # fold i holds every row whose position is ≡ i (mod folds).
+            rem = index % folds
+            test_sets = [index[rem == i] for i in range(folds)]
+            train_sets = [index[rem != i] for i in range(folds)]
+        test_indexes.extend(test_sets)
+        train_indexes.extend(train_sets)
+
+    return train_indexes, test_indexes
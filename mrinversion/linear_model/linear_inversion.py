@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.linalg
 
 __author__ = "Deepansh J. Srivastava"
 __email__ = "srivastava.89@osu.edu"
@@ -24,7 +25,9 @@ def find_optimum_singular_value(s):
 
 
 def TSVD(K):
-    U, S, VT = np.linalg.svd(K, full_matrices=False)
+    # check_finite=False skips the elementwise finiteness scan of the
+    # kernel; LAPACK gesdd is applied either way.
+    U, S, VT = scipy.linalg.svd(K, full_matrices=False, check_finite=False)
     r = find_optimum_singular_value(S)
     return U, S, VT, r
 
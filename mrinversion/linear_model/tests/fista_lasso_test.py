@@ -0,0 +1,41 @@
+import numpy as np
+
+from mrinversion.linear_model import fista_lasso
+
+
+def check_partition(train_indexes, test_indexes, folds, n_rows):
+    test_size = n_rows // folds
+    for train_index, test_index in zip(train_indexes, test_indexes):
+        assert test_index.size in (test_size, test_size + 1)
+        assert train_index.size + test_index.size == n_rows
+        # train and test sets are disjoint and cover all rows.
+        union = np.sort(np.concatenate((train_index, test_index)))
+        assert np.array_equal(union, np.arange(n_rows))
+
+
+def test_train_set_indexes():
+    X, y = np.empty((13, 4)), np.empty((13, 2))
+    folds = 5
+    train_indexes, test_indexes = fista_lasso.test_train_set(X, y, folds)
+
+    assert len(train_indexes) == folds
+    check_partition(train_indexes, test_indexes, folds, 13)
+
+    # every row appears in exactly one test set.
+    all_test = np.sort(np.concatenate(test_indexes))
+    assert np.array_equal(all_test, np.arange(13))
+
+
+def test_train_set_random_repeats():
+    X, y = np.empty((12, 4)), np.empty((12, 2))
+    folds, repeats = 4, 3
+    train_indexes, test_indexes = fista_lasso.test_train_set(
+        X, y, folds, random=True, repeat_folds=repeats
+    )
+
+    assert len(train_indexes) == folds * repeats
+    check_partition(train_indexes, test_indexes, folds, 12)
+
+    for j in range(repeats):
+        all_test = np.sort(np.concatenate(test_indexes[j * folds : (j + 1) * folds]))
+        assert np.array_equal(all_test, np.arange(12))
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from mrinversion.linear_model.fista import _fista_py
+
+try:
+    from mrinversion.linear_model.fista import fista
+except ImportError:
+    fista = None
+
+
+def setup_problem():
+    rng = np.random.RandomState(3)
+    K = np.asfortranarray(rng.rand(40, 30))
+    f_true = np.zeros((30, 2))
+    f_true[4] = 1.0
+    f_true[20] = 0.5
+    s = np.asfortranarray(K @ f_true + 0.001 * rng.randn(40, 2))
+    lipszit = np.linalg.svd(K, compute_uv=False)[0] ** 2
+    return K, s, f_true, lipszit
+
+
+def test_fista_py_recovers_sparse_solution():
+    K, s, f_true, lipszit = setup_problem()
+    f_k = np.zeros((30, 2), order="F")
+    _fista_py.fista(
+        matrix=K,
+        s=s,
+        lambd=1e-5,
+        maxiter=50000,
+        f_k=f_k,
+        nonnegative=1,
+        linv=1 / lipszit,
+        tol=5.2e-3,
+        npros=1,
+    )
+    assert np.allclose(f_k, f_true, atol=0.05)
+
+
+@pytest.mark.skipif(fista is None, reason="compiled fista extension unavailable")
+def test_fista_py_matches_fortran():
+    K, s, _, lipszit = setup_problem()
+    kwargs = dict(
+        matrix=K,
+        s=s,
+        maxiter=50000,
+        nonnegative=1,
+        linv=1 / lipszit,
+        tol=5.2e-3,
+        npros=1,
+    )
+    for lambd in (1e-3, 1e-5):
+        f_fortran = np.zeros((30, 2), order="F")
+        zf_fortran = fista.fista(lambd=lambd, f_k=f_fortran, **kwargs)[0]
+
+        f_python = np.zeros((30, 2), order="F")
+        zf_python = _fista_py.fista(lambd=lambd, f_k=f_python, **kwargs)[0]
+
+        assert np.allclose(f_fortran, f_python, atol=1e-10)
+        assert np.allclose(zf_fortran, zf_python, atol=1e-10)